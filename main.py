@@ -7,16 +7,19 @@ and sends email alerts on percentage changes.
 
 import yfinance as yf
 import pandas as pd
-import seaborn as sns
-import matplotlib.pyplot as plt
-import matplotlib.ticker as mticker
-import pandas_market_calendars as mcal
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import numpy as np
 import sys
 import os
 import smtplib
 import json
 import socket
 import requests
+import re
+import atexit
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from email.message import EmailMessage
 from pathlib import Path
 from datetime import datetime, time
@@ -28,7 +31,7 @@ class StockTracker:
 
     This class manages historical data efficiently by fetching only the
     missing records from the API, avoiding redundant requests and persisting
-    results to CSV files. It supports multiple intervals, including intraday
+    results to per-ticker Parquet files. It supports multiple intervals, including intraday
     and daily/longer ranges.
 
     Analytics and chart generation are provided for daily data, offering
@@ -42,6 +45,7 @@ class StockTracker:
 
     COLUMN_NAMES = ["Date", "Open", "High", "Low", "Close", "Volume", "Ticker"]
     MAX_LOOKBACK_DAYS = 40
+    MAX_FETCH_WORKERS = 8
     INTERVAL_TO_TIMEDIFF = {
         "1m": pd.Timedelta(minutes=1),
         "2m": pd.Timedelta(minutes=2),
@@ -57,22 +61,53 @@ class StockTracker:
         "3mo": pd.Timedelta(days=90)
     }
     
-    MASTER_HISTORY = None
-    MASTER_FILENAME = "data/historical_data_1d.csv"
+    # Chart tick formatters hold no per-chart state, so define them once and share them between charts
+    # None of them need matplotlib imported: it wraps a plain function in a FuncFormatter and a format string in a StrMethodFormatter
+    # Millions truncate to whole numbers, which a format spec can't express, so that one stays a function
+    MILLIONS_FORMATTER = staticmethod(lambda x, _: f'{int(x/1e6)}M')
+    DOLLARS_FORMATTER = "${x:,.0f}"
+    CENTS_FORMATTER = "${x:,.2f}"
+    TENTH_CENTS_FORMATTER = "${x:,.3f}"
+
+    # A valid email address has exactly one "@" and no spaces:
+    #   - the local part is dot-separated, non-empty pieces (no leading, trailing or doubled dots)
+    #   - the domain doesn't start with a dot and ends with a dot followed by a label of at least 2 characters
+    EMAIL_PATTERN = re.compile(r"[^@ .]+(?:\.[^@ .]+)*@[^@ .][^@ ]*\.[^@ .]{2,}")
+
+    MASTER_HISTORY = None # Daily history as {ticker: DataFrame sorted by Date}, so per-ticker lookups are a dict access
+    MASTER_DIRECTORY = "data/historical_data_1d"
+    VALIDATED_TICKERS = set() # Tickers confirmed to exist on Yahoo Finance during this session
+
+    # Shared keep-alive session so repeated connectivity checks reuse one TCP/TLS connection
+    HTTP_SESSION = requests.Session()
+    atexit.register(HTTP_SESSION.close)
+
+    MARKET_OPEN_TIME = time(hour=9, minute=30, second=0) # NYSE regular session, New York time
+    MARKET_CLOSE_TIME = time(hour=16, minute=0, second=0)
+
+    MARKET_PHASE_MESSAGES = {
+        "closed": "Market closed today (holiday/weekend).",
+        "pre": "Market not yet open — waiting to open.",
+        "open": "Market is open — wait until close for daily % change."
+    }
+
+    SMTP_CONNECTION = None # Logged-in SMTP connection kept open between email alerts (see get_smtp_connection)
 
     def __init__(self):
         """ 
-        Initialises the tracker by loading the master daily history file 
-        if it exists. Otherwise, informs the user that no daily data is available.
+        Initialises the tracker by loading the master daily history files if they exist.
+        Otherwise, informs the user that no daily data is available.
         """
 
-        if Path(StockTracker.MASTER_FILENAME).exists():
+        self.migrate_legacy_csv("1d")
+
+        if Path(StockTracker.MASTER_DIRECTORY).exists():
             try:
-                StockTracker.MASTER_HISTORY = self.load_from_csv(StockTracker.MASTER_FILENAME).sort_values(by=["Ticker", "Date"])
-            except pd.errors.ParserError as e:
-                print(f"\n⚠️  Could not load {StockTracker.MASTER_FILENAME}, File may be corrupted: {e}")
+                StockTracker.MASTER_HISTORY = self.split_by_ticker(self.load_tickers(self.get_cached_tickers("1d"), "1d").sort_values(by=["Ticker", "Date"]))
             except PermissionError as e:
-                print(f"\n⚠️  Could not read {StockTracker.MASTER_FILENAME}, Check file permissions: {e}")
+                print(f"\n⚠️  Could not read {StockTracker.MASTER_DIRECTORY}, Check file permissions: {e}")
+            except (ValueError, OSError) as e:
+                print(f"\n⚠️  Could not load {StockTracker.MASTER_DIRECTORY}, File may be corrupted: {e}")
         else:
             print(f"\n⚠️  Friendly Warning: No **1d** data available yet, Fetch historical data first — until then, option 3 and 4 won't work")
 
@@ -92,9 +127,9 @@ class StockTracker:
             while True:
                 try:
                     print(f"\n🏦 Welcome to the Stock Price Tracker!")
-                    option = int(input(f"\n1. Fetch Historical Data \n2. Fetch Live Price \n3. Analyse Stock Data \n4. Visualise Stock Data \n5. Configure & Test Percentage Change Alert \n6. Exit Program \n\nChoose an option: "))
-                    if option < 1 or option > 6:
-                        raise ValueError("Option must be between 1 and 6, Please try again")
+                    option = int(input(f"\n1. Fetch Historical Data \n2. Fetch Live Price \n3. Analyse Stock Data \n4. Visualise Stock Data \n5. Configure & Test Percentage Change Alert \n6. Export Historical Data to CSV \n7. Exit Program \n\nChoose an option: "))
+                    if option < 1 or option > 7:
+                        raise ValueError("Option must be between 1 and 7, Please try again")
                 except ValueError as e:
                     print(e)
                 else:
@@ -163,7 +198,7 @@ class StockTracker:
                 self.fetch_live_price(list_of_tickers)
 
             elif option == 3:
-                if Path(StockTracker.MASTER_FILENAME).exists():
+                if Path(StockTracker.MASTER_DIRECTORY).exists():
                     ticker = self.validated_ticker()
                     days_back = self.validated_look_back_value(2)
 
@@ -178,6 +213,14 @@ class StockTracker:
                 self.email_alert_menu()
 
             elif option == 6:
+                interval = self.get_interval()
+
+                if Path(self.get_directory(interval)).exists():
+                    self.export_to_csv(interval)
+                else:
+                    print(f"\n⚠️  Historical data for interval **{interval}** doesn't exist, Please fetch some data first (Option 1)")
+
+            elif option == 7:
                 self.exit_program()
     
     def chart_selection_menu(self):
@@ -202,7 +245,7 @@ class StockTracker:
                     break
             
             if option == 1:
-                if Path(StockTracker.MASTER_FILENAME).exists():
+                if Path(StockTracker.MASTER_DIRECTORY).exists():
                     ticker = self.validated_ticker()
                     days_back = self.validated_look_back_value(2)
 
@@ -211,7 +254,7 @@ class StockTracker:
                     print(f"\n⚠️  Historical data for interval **1d** doesn't exist, Please fetch some data first (Option 1)")
 
             elif option == 2:
-                if Path(StockTracker.MASTER_FILENAME).exists():
+                if Path(StockTracker.MASTER_DIRECTORY).exists():
                     ticker = self.validated_ticker()
                     days_back = self.validated_look_back_value(1)
 
@@ -220,7 +263,7 @@ class StockTracker:
                     print(f"\n⚠️  Historical data for interval **1d** doesn't exist, Please fetch some data first (Option 1)")
 
             elif option == 3:
-                if Path(StockTracker.MASTER_FILENAME).exists():
+                if Path(StockTracker.MASTER_DIRECTORY).exists():
                     ticker = self.validated_ticker()
                     days_back = self.validated_look_back_value(2)
 
@@ -229,7 +272,7 @@ class StockTracker:
                     print(f"\n⚠️  Historical data for interval **1d** doesn't exist, Please fetch some data first (Option 1)")
 
             elif option == 4:
-                if Path(StockTracker.MASTER_FILENAME).exists():
+                if Path(StockTracker.MASTER_DIRECTORY).exists():
                     ticker = self.validated_ticker()
                     days_back = self.validated_look_back_value(2)
 
@@ -238,7 +281,7 @@ class StockTracker:
                     print(f"\n⚠️  Historical data for interval **1d** doesn't exist, Please fetch some data first (Option 1)")
 
             elif option == 5:
-                if Path(StockTracker.MASTER_FILENAME).exists():
+                if Path(StockTracker.MASTER_DIRECTORY).exists():
                     ticker = self.validated_ticker()
                     days_back = self.validated_look_back_value(2)
 
@@ -305,14 +348,16 @@ class StockTracker:
                 try:
                     data = None
 
-                    with open("alert_config.json", "r") as f:
+                    # Read and rewrite the config through a single handle instead of reopening the file for writing
+                    with open("alert_config.json", "r+") as f:
                         data = json.load(f)
                         data["tickers"] = list_of_tickers
                         data["threshold"] = threshold_value
                         data["recipient_email"] = recipient_email
 
-                    with open("alert_config.json", "w") as f:
+                        f.seek(0)
                         json.dump(data, f, indent=4)
+                        f.truncate() # Drop any leftover bytes if the new content is shorter than the old
 
                     print(f"\nConfiguration Successful!")
                 except json.JSONDecodeError:
@@ -345,7 +390,7 @@ class StockTracker:
 
     def fetch_historical_data(self, list_of_tickers, start, end, interval, verbose=False):
         """
-        Fetches historical stock data for a list of tickers and updates the local CSV cache.
+        Fetches historical stock data for a list of tickers and updates the local Parquet cache.
 
         Parameters
         ----------
@@ -362,176 +407,139 @@ class StockTracker:
 
         Notes
         -----
-        If a CSV file for the interval exists, only missing data is fetched from the API.
-        If the file does not exist, all requested data is fetched from the API. 
-        The local CSV is updated after data retrieval to maintain a cache.
+        Each ticker is cached in its own Parquet file per interval, so only the requested
+        tickers are read from disk. If a ticker's file exists, only missing data is fetched
+        from the API. If it does not exist, all requested data is fetched from the API.
+        After data retrieval, only the files of tickers that received new rows are rewritten.
         """
 
-        # Convert string to datetime (defaults to naive/no timezone)
-        start = pd.to_datetime(start)
-        # If naive (no timezone), attach New York timezone
-        # If already tz-aware, convert it to New York timezone
-        if start.tzinfo is None:
-            start = start.tz_localize("America/New_York")
-        else:
-            start = start.tz_convert("America/New_York")
-        
-        # Repeat for end date
-        end = pd.to_datetime(end)
-        # Localize if naive, convert if already tz-aware
-        if end.tzinfo is None:
-            end = end.tz_localize("America/New_York")
-        else:
-            end = end.tz_convert("America/New_York")
+        # Parse both dates as New York timestamps (memoised, since the same date strings recur across calls)
+        start = self.to_new_york_timestamp(start)
+        end = self.to_new_york_timestamp(end)
 
-        filename = self.get_filename(interval)
+        self.migrate_legacy_csv(interval)
+        directory = self.get_directory(interval)
 
-        if Path(filename).exists():
-            try:
-                # Load CSV and ensure data is ordered by Ticker (grouped) and Date (chronological)
-                compiled_history = self.load_from_csv(filename).sort_values(by=["Ticker", "Date"])
-            except pd.errors.ParserError as e:
-                print(f"\n⚠️  Could not load {filename}, File may be corrupted: {e}")
-            except PermissionError as e:
-                print(f"\n⚠️  Could not read {filename}, Check file permissions: {e}")
+        if Path(directory).exists():
+            # Each requested ticker's cached rows sorted by Date; its keys double as an O(1) lookup of which tickers are cached
+            ticker_histories = {}
+
+            if interval == "1d" and StockTracker.MASTER_HISTORY is not None:
+                # The daily history is already in memory, so reuse it instead of reading the files from disk again
+                ticker_histories = {ticker: StockTracker.MASTER_HISTORY[ticker] for ticker in list_of_tickers if ticker in StockTracker.MASTER_HISTORY}
+
+            # Any ticker not already in memory is read from its file, if it has one
+            unloaded_tickers = [ticker for ticker in list_of_tickers if ticker not in ticker_histories]
+            if unloaded_tickers:
+                try:
+                    # Load only these tickers' files and ensure data is ordered by Ticker (grouped) and Date (chronological)
+                    compiled_history = self.load_tickers(unloaded_tickers, interval).sort_values(by=["Ticker", "Date"])
+                    ticker_histories.update(self.split_by_ticker(compiled_history))
+                except PermissionError as e:
+                    print(f"\n⚠️  Could not read {directory}, Check file permissions: {e}")
+                except (ValueError, OSError) as e:
+                    print(f"\n⚠️  Could not load {directory}, File may be corrupted: {e}")
 
             present_tickers = []
             missing_tickers = []
             fully_checked_tickers = []
 
             for ticker in list_of_tickers:
-                if ticker in compiled_history["Ticker"].values:
+                if ticker in ticker_histories:
                     present_tickers.append(ticker)
                 else:
                     missing_tickers.append(ticker)
 
+            # Collect every (ticker, start, end) range that needs fetching, then request them concurrently below
+            fetch_jobs = []
+            # Fetched frames are gathered here and merged into each ticker's cached rows afterwards
+            new_frames = []
+
             for ticker in present_tickers:
                 # Returns a dataframe for just that ticker
-                ticker_specific_dataframe = compiled_history[compiled_history["Ticker"] == ticker]
+                ticker_specific_dataframe = ticker_histories[ticker]
 
                 # Check for gaps between start and end
                 internal_gaps = self.get_internal_missing_ranges(ticker_specific_dataframe, start, end, interval)
-                ticker_object = yf.Ticker(ticker)
                 for gap_start, gap_end in internal_gaps:
-                    try:
-                        history = ticker_object.history(start=gap_start, end=gap_end, interval=interval).reset_index().drop(["Dividends", "Stock Splits", "Adj Close"], axis="columns", errors="ignore")
-                    except Exception as e:
-                        print(f"\n⚠️  Error fetching data for {ticker}: {e}")
-                        history = pd.DataFrame()
+                    fetch_jobs.append((ticker, gap_start, gap_end))
 
-                    history["Ticker"] = ticker
-
-                    # For intraday intervals Yahoo returns "Datetime" instead of "Date" → normalise column name
-                    if "Datetime" in history.columns:
-                            history = history.rename(columns={"Datetime": "Date"})
-
-                    # Skip if no data returned (e.g. weekends/holidays), else append new rows to compiled_history
-                    if history.empty:
-                            pass
-                    else:
-                        compiled_history = pd.concat([compiled_history, history], ignore_index=True)
+                # Each cached history is kept sorted by date, so its first and last rows are the earliest and latest dates (no column scans)
+                earliest_date = ticker_specific_dataframe["Date"].iat[0]
+                latest_date = ticker_specific_dataframe["Date"].iat[-1]
 
                 # Check to see if the shortest date in the dataframe is earlier than or equal to the start date
                 # Check to see if the longest date in the dateframe is later than or equal to the end date
-                if start >= ticker_specific_dataframe["Date"].min() and end <= ticker_specific_dataframe["Date"].max():
+                if start >= earliest_date and end <= latest_date:
                     pass
                 else:
-                    if start < ticker_specific_dataframe["Date"].min() < end:
-                        ticker_object = yf.Ticker(ticker)
-                        try:
-                            history = ticker_object.history(start=start, end=ticker_specific_dataframe["Date"].min(), interval=interval).reset_index().drop(["Dividends", "Stock Splits", "Adj Close"], axis="columns", errors="ignore")
-                        except Exception as e:
-                            print(f"\n⚠️  Error fetching data for {ticker}: {e}")
-                            history = pd.DataFrame()
+                    if start < earliest_date < end:
+                        fetch_jobs.append((ticker, start, earliest_date))
 
-                        history["Ticker"] = ticker
-
-                        # For intraday intervals Yahoo returns "Datetime" instead of "Date" → normalise column name
-                        if "Datetime" in history.columns:
-                            history = history.rename(columns={"Datetime": "Date"})
-
-                        # Skip if no data returned (e.g. weekends/holidays), else append new rows to compiled_history
-                        if history.empty:
-                            pass
-                        else:
-                            compiled_history = pd.concat([compiled_history, history], ignore_index=True)
+                    if end > latest_date > start:
+                        fetch_jobs.append((ticker, latest_date, end))
 
-                    if end > ticker_specific_dataframe["Date"].max() > start:
-                        ticker_object = yf.Ticker(ticker)
-                        try:
-                            history = ticker_object.history(start=ticker_specific_dataframe["Date"].max(), end=end, interval=interval).reset_index().drop(["Dividends", "Stock Splits", "Adj Close"], axis="columns", errors="ignore")
-                        except Exception as e:
-                            print(f"\n⚠️  Error fetching data for {ticker}: {e}")
-                            history = pd.DataFrame()
+                fully_checked_tickers.append(ticker)
 
-                        history["Ticker"] = ticker
+            # Each range is an independent blocking HTTP request, so overlap them in a thread pool
+            if fetch_jobs:
+                with ThreadPoolExecutor(max_workers=StockTracker.MAX_FETCH_WORKERS) as executor:
+                    fetched_histories = list(executor.map(lambda job: self.fetch_range(*job, interval), fetch_jobs))
 
-                        # For intraday intervals Yahoo returns "Datetime" instead of "Date" → normalise column name
-                        if "Datetime" in history.columns:
-                            history = history.rename(columns={"Datetime": "Date"})
+                # Skip ranges that returned no data (e.g. weekends/holidays)
+                new_frames.extend(history for history in fetched_histories if not history.empty)
 
-                        # Skip if no data returned (e.g. weekends/holidays), else append new rows to compiled_history
-                        if history.empty:
-                            pass
-                        else:
-                            compiled_history = pd.concat([compiled_history, history], ignore_index=True)
+            # Uncached tickers all share the same requested range, so fetch them together in one batched download
+            if missing_tickers:
+                new_frames.extend(self.download_history(missing_tickers, start, end, interval))
+                fully_checked_tickers.extend(missing_tickers)
 
-                fully_checked_tickers.append(ticker)
-                    
-            for ticker in missing_tickers:
-                ticker_object = yf.Ticker(ticker)
-                try:
-                    history = ticker_object.history(start=start, end=end, interval=interval).reset_index().drop(["Dividends", "Stock Splits", "Adj Close"], axis="columns", errors="ignore")
-                except Exception as e:
-                    print(f"\n⚠️  Error fetching data for {ticker}: {e}")
-                    history = pd.DataFrame()
+            # Group the fetched frames by ticker so each ticker's history is merged on its own
+            fetched_by_ticker = {}
+            for history in new_frames:
+                fetched_by_ticker.setdefault(history["Ticker"].iloc[0], []).append(history)
 
-                history["Ticker"] = ticker
+            # Only tickers that received data are merged; every other ticker's rows are never copied or re-sorted
+            updated_histories = {}
+            for ticker, fetched_frames in fetched_by_ticker.items():
+                cached_history = ticker_histories.get(ticker)
+                merged_history = self.merge_ticker_history(cached_history, fetched_frames)
 
-                # For intraday intervals Yahoo returns "Datetime" instead of "Date" → normalise column name
-                if "Datetime" in history.columns:
-                    history = history.rename(columns={"Datetime": "Date"})     
+                # Refetched boundary rows are dropped as duplicates, so only a longer history means new data arrived
+                if cached_history is None or len(merged_history) > len(cached_history):
+                    updated_histories[ticker] = merged_history
 
-                # Skip if no data returned (e.g. weekends/holidays), else append new rows to compiled_history
-                if history.empty:
-                    pass
-                else:
-                    compiled_history = pd.concat([compiled_history, history], ignore_index=True)       
+            ticker_histories.update(updated_histories)
 
-                fully_checked_tickers.append(ticker)   
-        
-            # Remove duplicate rows based on Date and Ticker, then sort by Ticker and Date
-            # inplace=True updates compiled_history directly without creating a new DataFrame
-            compiled_history.drop_duplicates(subset=["Date", "Ticker"], inplace=True)
-            compiled_history.sort_values(by=["Ticker", "Date"], inplace=True)
-            try:
-                self.save_to_csv(compiled_history, filename)
-            except PermissionError as e:
-                print(f"\n⚠️  Could not write to {filename}, Check file permissions: {e}")
-            except OSError as e:
-                print(f"\n⚠️  OS error while saving {filename}: {e}")
+            # Only the tickers that actually received new rows need their files rewritten; a full cache hit writes nothing
+            if updated_histories:
+                try:
+                    self.save_to_parquet(updated_histories, interval)
+                except PermissionError as e:
+                    print(f"\n⚠️  Could not write to {directory}, Check file permissions: {e}")
+                except OSError as e:
+                    print(f"\n⚠️  OS error while saving {directory}: {e}")
 
             if interval == "1d":
-                StockTracker.MASTER_HISTORY = compiled_history
+                # ticker_histories only holds the requested tickers, so replace just the updated tickers' entries in the master history
+                if StockTracker.MASTER_HISTORY is None:
+                    StockTracker.MASTER_HISTORY = ticker_histories
+                elif updated_histories:
+                    StockTracker.MASTER_HISTORY.update(updated_histories)
 
             if verbose:
-                combined_resulting_dataframe = pd.DataFrame(columns=StockTracker.COLUMN_NAMES) # Creating an empty dataframe so each tickers filtered data can be appeneded on and representred as one big dataframe
-                # Forces each column into the correct data type
-                combined_resulting_dataframe = combined_resulting_dataframe.astype({
-                    "Date": "datetime64[ns]",
-                    "Open": "float64",
-                    "High": "float64",
-                    "Low": "float64",
-                    "Close": "float64",
-                    "Volume": "Int64",
-                    "Ticker": "string"
-                })
-
+                # Each history is sorted by date, so binary search slices out the requested range before anything is copied,
+                # and only those rows are combined into one big dataframe
+                checked_histories = []
                 for ticker in fully_checked_tickers:
-                    combined_resulting_dataframe = pd.concat([combined_resulting_dataframe, compiled_history[(compiled_history["Ticker"] == ticker) & (compiled_history["Date"] >= start) & (compiled_history["Date"] <= end)]])
-
-                print() # Readability purposes
-                print(combined_resulting_dataframe.to_string())
+                    if ticker in ticker_histories:
+                        dates = ticker_histories[ticker]["Date"]
+                        checked_histories.append(ticker_histories[ticker].iloc[dates.searchsorted(start, side="left"):dates.searchsorted(end, side="right")])
+                if checked_histories:
+                    combined_resulting_dataframe = self.concat_frames(checked_histories)
+
+                    print() # Readability purposes
+                    print(combined_resulting_dataframe.to_string())
         else:
             compiled_history = pd.DataFrame(columns=StockTracker.COLUMN_NAMES)
             # Forces each column into the correct data type
@@ -542,47 +550,134 @@ class StockTracker:
                 "Low": "float64",
                 "Close": "float64",
                 "Volume": "Int64",
-                "Ticker": "string"
+                "Ticker": "category"
             })
 
-            for ticker in list_of_tickers:
-                ticker_object = yf.Ticker(ticker)
-                try:
-                    history = ticker_object.history(start=start, end=end, interval=interval).reset_index().drop(["Dividends", "Stock Splits", "Adj Close"], axis="columns", errors="ignore")
-                except Exception as e:
-                    print(f"\n⚠️  Error fetching data for {ticker}: {e}")
-                    history = pd.DataFrame()
-
-                history["Ticker"] = ticker
+            # Nothing is cached for this interval yet, so every ticker is fetched in one batched download
+            downloaded_histories = self.download_history(list_of_tickers, start, end, interval)
+            if downloaded_histories:
+                compiled_history = self.concat_frames(downloaded_histories)
 
-                # For intraday intervals Yahoo returns "Datetime" instead of "Date" → normalise column name
-                if "Datetime" in history.columns:
-                    history = history.rename(columns={"Datetime": "Date"})
-
-                # Skip if no data returned (e.g. weekends/holidays), else append new rows to compiled_history
-                if history.empty:
-                    pass
-                else:
-                    compiled_history = pd.concat([compiled_history, history], ignore_index=True)
-            
             if compiled_history.empty:
                 pass
             else:
+                compiled_history["Ticker"] = compiled_history["Ticker"].astype("category")
                 compiled_history.drop_duplicates(subset=["Date", "Ticker"], inplace=True)
                 compiled_history.sort_values(by=["Ticker", "Date"], inplace=True)
                 try:
-                    self.save_to_csv(compiled_history, filename)
+                    self.save_to_parquet(self.split_by_ticker(compiled_history), interval)
                 except PermissionError as e:
-                    print(f"\n⚠️  Could not write to {filename}, Check file permissions: {e}")
+                    print(f"\n⚠️  Could not write to {directory}, Check file permissions: {e}")
                 except OSError as e:
-                    print(f"\n⚠️  OS error while saving {filename}: {e}")
+                    print(f"\n⚠️  OS error while saving {directory}: {e}")
 
             if interval == "1d":
-                StockTracker.MASTER_HISTORY = compiled_history
+                StockTracker.MASTER_HISTORY = self.split_by_ticker(compiled_history)
 
             if verbose:
                 print(compiled_history.to_string())
 
+    @staticmethod
+    def fetch_range(ticker, start, end, interval):
+        """
+        Fetches historical data for a single ticker over one date range.
+
+        Parameters
+        ----------
+        ticker : str
+            The ticker to retrieve data for.
+        start : pd.Timestamp
+            The start of the date range (inclusive).
+        end : pd.Timestamp
+            The end of the date range (exclusive).
+        interval : str
+            The data interval/granularity (e.g., '1d', '1m', '5m').
+
+        Returns
+        -------
+        pd.DataFrame
+            The fetched rows tagged with the ticker, or an empty DataFrame if nothing was returned.
+        """
+
+        ticker_object = yf.Ticker(ticker)
+        try:
+            history = ticker_object.history(start=start, end=end, interval=interval).reset_index().drop(["Dividends", "Stock Splits", "Adj Close"], axis="columns", errors="ignore")
+        except Exception as e:
+            print(f"\n⚠️  Error fetching data for {ticker}: {e}")
+            history = pd.DataFrame()
+
+        history["Ticker"] = ticker
+
+        # For intraday intervals Yahoo returns "Datetime" instead of "Date" → normalise column name
+        if "Datetime" in history.columns:
+            history = history.rename(columns={"Datetime": "Date"})
+
+        # history() returns the exchange's own timezone (e.g. Europe/London for .L tickers), so convert to New York like download_history
+        if "Date" in history.columns:
+            history["Date"] = pd.to_datetime(history["Date"], utc=True).dt.tz_convert("America/New_York")
+
+        return history
+
+    @staticmethod
+    def download_history(list_of_tickers, start, end, interval):
+        """
+        Downloads historical data for several tickers over the same range in one batched request.
+
+        Parameters
+        ----------
+        list_of_tickers : list of str
+            The tickers to retrieve data for.
+        start : pd.Timestamp
+            The start of the date range (inclusive).
+        end : pd.Timestamp
+            The end of the date range (exclusive).
+        interval : str
+            The data interval/granularity (e.g., '1d', '1m', '5m').
+
+        Returns
+        -------
+        list of pd.DataFrame
+            One frame per ticker that returned data, with columns matching `COLUMN_NAMES`.
+
+        Notes
+        -----
+        Uses adjusted prices and keeps the exchange timezone so rows line up with
+        those fetched through `yf.Ticker(...).history()`.
+        """
+
+        try:
+            downloaded = yf.download(list_of_tickers, start=start, end=end, interval=interval, group_by="ticker", auto_adjust=True, ignore_tz=False, threads=True, progress=False)
+        except Exception as e:
+            print(f"\n⚠️  Error fetching data for {', '.join(list_of_tickers)}: {e}")
+            return []
+
+        if downloaded is None or downloaded.empty:
+            return []
+
+        # Batched downloads are indexed in UTC, convert back to New York time to match the cache
+        downloaded.index = downloaded.index.tz_convert("America/New_York")
+
+        histories = []
+        for ticker in list_of_tickers:
+            if ticker not in downloaded.columns.get_level_values(0):
+                continue
+
+            # Tickers are aligned on a shared index, so rows where this ticker has no bar are all NaN
+            history = downloaded[ticker].dropna(subset=["Close"])
+
+            # Skip if no data returned (e.g. invalid ticker or weekends/holidays)
+            if history.empty:
+                continue
+
+            # Intraday indexes are named "Datetime" instead of "Date" → normalise the name before resetting
+            history = history.rename_axis(index="Date", columns=None).reset_index().drop(["Dividends", "Stock Splits", "Adj Close"], axis="columns", errors="ignore")
+            # NaN alignment turns Volume into floats, restore the integer type used by history()
+            history["Volume"] = history["Volume"].fillna(0).astype("int64")
+            history["Ticker"] = ticker
+            histories.append(history)
+
+        return histories
+
     @staticmethod
     def fetch_live_price(list_of_tickers):
         """
@@ -594,17 +689,25 @@ class StockTracker:
             The tickers to fetch live prices for.
         """
 
-        print(f"\nLive Prices of Tickers:\n")
-        for ticker in list_of_tickers:
+        def get_last_price(ticker):
+            # Returns (price, error) so failures can be reported in order once every request has finished
             try:
-                current_ticker = yf.Ticker(ticker)
-                last_price = current_ticker.fast_info.get("lastPrice")
-                if last_price is not None:
-                    print(f"{ticker} current price = ${last_price:.2f}")
-                else:
-                    print(f"\n⚠️  {ticker}: Price data not available")
+                return yf.Ticker(ticker).fast_info.get("lastPrice"), None
             except Exception as e:
-                print(f"\n⚠️  Error fetching live price for {ticker}: {e}")
+                return None, e
+
+        # Each lookup is a blocking HTTP request, so run them concurrently; map keeps the input order
+        with ThreadPoolExecutor(max_workers=min(StockTracker.MAX_FETCH_WORKERS, len(list_of_tickers))) as executor:
+            results = list(executor.map(get_last_price, list_of_tickers))
+
+        print(f"\nLive Prices of Tickers:\n")
+        for ticker, (last_price, error) in zip(list_of_tickers, results):
+            if error is not None:
+                print(f"\n⚠️  Error fetching live price for {ticker}: {error}")
+            elif last_price is not None:
+                print(f"{ticker} current price = ${last_price:.2f}")
+            else:
+                print(f"\n⚠️  {ticker}: Price data not available")
  
     def analyse_stock_data(self, ticker, days_range):
         """
@@ -625,16 +728,20 @@ class StockTracker:
 
         # Calculations
 
-        new_close = requested_range_dataframe["Close"].iloc[-1]
-        old_close = requested_range_dataframe["Close"].iloc[-2]
+        # Index the raw closing prices directly instead of going through .iloc for each scalar
+        closes = requested_range_dataframe["Close"].to_numpy()
+
+        new_close = closes[-1]
+        old_close = closes[-2]
 
-        first_close = requested_range_dataframe["Close"].iloc[0]
+        first_close = closes[0]
 
         daily_percentage_change = ((new_close - old_close) / old_close) * 100 
-        highest_high = requested_range_dataframe["High"].max()
-        lowest_low = requested_range_dataframe["Low"].min()
-        avg_closing = requested_range_dataframe["Close"].mean()
-        avg_volume = round(requested_range_dataframe["Volume"].mean())
+        # Reduce the raw NumPy arrays directly; the nan-aware versions skip missing values just like the pandas methods
+        highest_high = np.nanmax(requested_range_dataframe["High"].to_numpy())
+        lowest_low = np.nanmin(requested_range_dataframe["Low"].to_numpy())
+        avg_closing = np.nanmean(closes)
+        avg_volume = round(np.nanmean(requested_range_dataframe["Volume"].to_numpy(dtype="float64", na_value=np.nan)))
         range_percentage_change = ((new_close - first_close) / first_close) * 100 # % change in closing price across the entire range (first → last day)
 
         # Printing out the stats
@@ -667,10 +774,24 @@ class StockTracker:
 
         requested_range_dataframe, valid_trading_days, days_range = self.get_requested_range_dataframe(ticker, days_range)
 
-        requested_range_dataframe["% daily change"] = requested_range_dataframe["Close"].pct_change() * 100
-        requested_range_dataframe = requested_range_dataframe.dropna(subset=["% daily change"]).copy()
-        requested_range_dataframe["Positive/Negative"] = requested_range_dataframe["% daily change"].apply(lambda x: "Positive" if x >= 0 else "Negative") # Label each row as "Positive" or "Negative" based on the sign of its daily % change
-        requested_range_dataframe["Shortend Date"] = requested_range_dataframe["Date"].dt.strftime("%d-%m-%Y")
+        plt = self.get_pyplot()
+        from seaborn import desaturate # Already loaded by get_pyplot, so this is just a lookup
+
+        # Daily % change computed in one NumPy pass over the closing prices; the first day has no previous close, so it is NaN
+        closes = requested_range_dataframe["Close"].to_numpy()
+        daily_change = np.empty_like(closes)
+        daily_change[0] = np.nan
+        daily_change[1:] = (closes[1:] / closes[:-1] - 1.0) * 100
+
+        # Drop the NaN rows with a boolean mask and add both derived columns in one assign, so only one new frame is built
+        has_change = ~np.isnan(daily_change)
+        daily_change = daily_change[has_change]
+        requested_range_dataframe = requested_range_dataframe[has_change].assign(**{
+            "% daily change": daily_change,
+            # Label each row as "Positive" or "Negative" based on the sign of its daily % change, in one vectorised pass
+            # Stored as a 2-category Categorical so the colour lookup below maps the 2 categories rather than every row
+            "Positive/Negative": pd.Categorical(np.where(daily_change >= 0, "Positive", "Negative"), categories=["Positive", "Negative"])
+        })
         colours = {
             "Positive": "#2ecc71",
             "Negative": "#e74c3c"
@@ -681,20 +802,26 @@ class StockTracker:
         fig = plt.figure(figsize=(8, 5))
         fig.canvas.manager.set_window_title(f"{ticker} - Daily % Change")
 
-        sns.set_style("whitegrid")
-        sns.set_context("notebook")
-
         plt.axhline(0, color = "black", linewidth = 1)
-        sns.barplot(x="Shortend Date", y="% daily change", data=requested_range_dataframe, hue="Positive/Negative", palette=colours)
+        # Plain matplotlib bars, one colour per row, skip seaborn's estimator and categorical-axis setup (values are already one per day)
+        # The colours are desaturated the same way seaborn's barplot does, so the chart looks unchanged
+        positions = np.arange(len(requested_range_dataframe))
+        # Desaturate once per category, then pick each bar's RGB row by its category code
+        labels = requested_range_dataframe["Positive/Negative"].cat
+        palette = np.array([desaturate(colours[label], 0.75) for label in labels.categories])
+        bar_colours = palette[labels.codes.to_numpy()]
+        plt.bar(positions, requested_range_dataframe["% daily change"], width=0.8, color=bar_colours)
 
         plt.title(f"{ticker} - Daily Percentage Change (Last {days_range - 1} Trading Days)")
         plt.xlabel("Date")
         plt.ylabel("% change")
-        plt.xticks(rotation=45)
-        plt.legend([],[], frameon=False)
+        plt.xticks(positions, requested_range_dataframe["Shortend Date"], rotation=45)
+        plt.xlim(-0.5, len(positions) - 0.5)
+        plt.gca().xaxis.grid(False)
 
         plt.tight_layout()
         plt.show()
+        plt.close(fig) # Release the figure once its window is closed so repeated charts don't accumulate in pyplot's registry
 
     def generate_volume_over_time_chart(self, ticker, days_range):
         """
@@ -711,27 +838,30 @@ class StockTracker:
 
         requested_range_dataframe, valid_trading_days, days_range = self.get_requested_range_dataframe(ticker, days_range)
 
-        requested_range_dataframe["Shortend Date"] = requested_range_dataframe["Date"].dt.strftime("%d-%m-%Y")
+        plt = self.get_pyplot()
+        from seaborn import desaturate # Already loaded by get_pyplot, so this is just a lookup
 
         fig = plt.figure(figsize=(8, 5))
         fig.canvas.manager.set_window_title(f"{ticker} - Volume Over Time")
 
-        sns.set_style("whitegrid")
-        sns.set_context("notebook")
-
-        sns.barplot(x="Shortend Date", y="Volume", data=requested_range_dataframe, color="#3498db")
+        # Plain matplotlib bars (desaturated like seaborn's barplot) without seaborn's estimator and categorical-axis setup
+        positions = np.arange(len(requested_range_dataframe))
+        plt.bar(positions, requested_range_dataframe["Volume"], width=0.8, color=desaturate("#3498db", 0.75))
 
         plt.title(f"{ticker} - Daily Trading Volume (Last {days_range} Trading Days)")
         plt.xlabel("Date")
         plt.ylabel("Volume")
-        plt.xticks(rotation=45) 
+        plt.xticks(positions, requested_range_dataframe["Shortend Date"], rotation=45)
+        plt.xlim(-0.5, len(positions) - 0.5)
 
         # Format y-axis in millions for readability
         ax = plt.gca()
-        ax.yaxis.set_major_formatter(mticker.FuncFormatter(lambda x, _: f'{int(x/1e6)}M'))
+        ax.xaxis.grid(False)
+        ax.yaxis.set_major_formatter(StockTracker.MILLIONS_FORMATTER)
 
         plt.tight_layout()
         plt.show()
+        plt.close(fig)
 
     def generate_closing_price_vs_moving_average_chart(self, ticker, days_range):
         """
@@ -748,30 +878,37 @@ class StockTracker:
         
         requested_range_dataframe, valid_trading_days, days_range = self.get_requested_range_dataframe(ticker, days_range)
 
-        requested_range_dataframe["Shortend Date"] = requested_range_dataframe["Date"].dt.strftime("%d-%m-%Y")
-        requested_range_dataframe["5D MA"] = requested_range_dataframe["Close"].rolling(window=5).mean()
+        plt = self.get_pyplot()
+
+        # 5-day moving average from a running sum: each window's total is the difference of two cumulative sums
+        # The first 4 days don't have a full window yet, so they stay NaN (same as rolling(window=5).mean())
+        closes = requested_range_dataframe["Close"].to_numpy()
+        running_total = np.concatenate(([0.0], closes.cumsum()))
+        moving_average = np.full_like(closes, np.nan)
+        moving_average[4:] = (running_total[5:] - running_total[:-5]) / 5
+        requested_range_dataframe = requested_range_dataframe.assign(**{"5D MA": moving_average})
 
         fig = plt.figure(figsize=(8, 5))
         fig.canvas.manager.set_window_title(f"{ticker} - Closing Price vs Moving Average")
 
-        sns.set_style("whitegrid")
-        sns.set_context("notebook")
+        positions = np.arange(len(requested_range_dataframe)) # One evenly spaced x position per trading day (no weekend gaps)
 
-        sns.lineplot(x="Shortend Date", y="Close", data=requested_range_dataframe, label="Closing Price", color="#2980b9")
-        sns.lineplot(x="Shortend Date", y="5D MA", data=requested_range_dataframe, label="5-Day MA", color="#f39c12")
+        plt.plot(positions, requested_range_dataframe["Close"], label="Closing Price", color="#2980b9")
+        plt.plot(positions, requested_range_dataframe["5D MA"], label="5-Day MA", color="#f39c12")
 
         plt.title(f"{ticker} - Closing Price with 5-Day Moving Average (Last {days_range} Trading Days)")
         plt.xlabel("Date")
         plt.ylabel("Price")
-        plt.xticks(rotation=45)
+        plt.xticks(positions, requested_range_dataframe["Shortend Date"], rotation=45)
         plt.legend()
 
         ax = plt.gca()
-        ax.yaxis.set_major_formatter(mticker.FuncFormatter(lambda x, _: f'${x:,.0f}'))
-        plt.xlim(requested_range_dataframe["Shortend Date"].iloc[0], requested_range_dataframe["Shortend Date"].iloc[-1])
+        ax.yaxis.set_major_formatter(StockTracker.DOLLARS_FORMATTER)
+        plt.xlim(positions[0], positions[-1])
 
         plt.tight_layout()
         plt.show()
+        plt.close(fig)
 
     def generate_high_low_range_chart(self, ticker, days_range):
         """
@@ -789,30 +926,32 @@ class StockTracker:
         """
 
         requested_range_dataframe, valid_trading_days, days_range = self.get_requested_range_dataframe(ticker, days_range)
+
+        plt = self.get_pyplot()
         
-        requested_range_dataframe["Shortend Date"] = requested_range_dataframe["Date"].dt.strftime("%d-%m-%Y")
-        requested_range_dataframe["High-Low Range"] = (requested_range_dataframe["High"] - requested_range_dataframe["Low"])
+        # Subtract the raw arrays rather than copying the frame to hold a display-only column
+        high_low_range = requested_range_dataframe["High"].to_numpy() - requested_range_dataframe["Low"].to_numpy()
 
         fig = plt.figure(figsize=(8, 5))
         fig.canvas.manager.set_window_title(f"{ticker} - Daily High-Low Range")
 
-        sns.set_style("whitegrid")
-        sns.set_context("notebook")
+        positions = np.arange(len(requested_range_dataframe)) # One evenly spaced x position per trading day (no weekend gaps)
 
-        plt.fill_between(requested_range_dataframe["Shortend Date"], requested_range_dataframe["High-Low Range"], color="#3498db", alpha=0.4, edgecolor="#2980b9")
+        plt.fill_between(positions, high_low_range, color="#3498db", alpha=0.4, edgecolor="#2980b9")
 
         plt.title(f"{ticker} - Daily High-Low Range (Last {days_range} Trading Days)")
         plt.xlabel("Date")
         plt.ylabel("Price Range")
-        plt.xticks(rotation=45)
+        plt.xticks(positions, requested_range_dataframe["Shortend Date"], rotation=45)
 
-        plt.xlim(requested_range_dataframe["Shortend Date"].iloc[0], requested_range_dataframe["Shortend Date"].iloc[-1])
+        plt.xlim(positions[0], positions[-1])
         plt.ylim(bottom=0)
         ax = plt.gca()
-        ax.yaxis.set_major_formatter(mticker.FuncFormatter(lambda x, _: f'${x:,.0f}'))
+        ax.yaxis.set_major_formatter(StockTracker.DOLLARS_FORMATTER)
 
         plt.tight_layout()
         plt.show()
+        plt.close(fig)
 
     def generate_cumulative_returns_chart(self, ticker, days_range, investment_amount):
         """
@@ -834,36 +973,40 @@ class StockTracker:
         
         requested_range_dataframe, valid_trading_days, days_range = self.get_requested_range_dataframe(ticker, days_range)
 
-        requested_range_dataframe["% daily change"] = requested_range_dataframe["Close"].pct_change() # Daily returns as fractional change (e.g., 0.02 = +2%)
-        multipliers = (1 + requested_range_dataframe["% daily change"]).fillna(1) # Convert returns to growth multipliers (1 + change); replace NaN in first row with 1 (no change)
-        requested_range_dataframe["Cumulative Returns"] = investment_amount * multipliers.cumprod() # Cumulative compounded value of investment over time
-        requested_range_dataframe["Shortend Date"] = requested_range_dataframe["Date"].dt.strftime("%d-%m-%Y")
+        plt = self.get_pyplot()
+
+        # Compounding the daily growth multipliers telescopes to each close divided by the first close,
+        # so the investment's value is one vectorised division instead of pct_change → fillna → cumprod
+        closes = requested_range_dataframe["Close"].to_numpy()
+        requested_range_dataframe = requested_range_dataframe.assign(**{
+            "Cumulative Returns": investment_amount * (closes / closes[0]) # Cumulative compounded value of investment over time
+        })
 
         fig = plt.figure(figsize=(8, 5))
         fig.canvas.manager.set_window_title(f"{ticker} - Cumulative Returns")
 
-        sns.set_style("whitegrid")
-        sns.set_context("notebook")
+        positions = np.arange(len(requested_range_dataframe)) # One evenly spaced x position per trading day (no weekend gaps)
 
-        sns.lineplot(x="Shortend Date", y="Cumulative Returns", data=requested_range_dataframe, color="#e67e22", linewidth=2)
+        plt.plot(positions, requested_range_dataframe["Cumulative Returns"], color="#e67e22", linewidth=2)
 
         plt.title(f"{ticker} - Cumulative Returns (Last {days_range} Trading Days)")
         plt.xlabel("Date")
         plt.ylabel(f"Value of a ${investment_amount:,} Investment")
-        plt.xticks(rotation=45)
+        plt.xticks(positions, requested_range_dataframe["Shortend Date"], rotation=45)
 
-        plt.xlim(requested_range_dataframe["Shortend Date"].iloc[0], requested_range_dataframe["Shortend Date"].iloc[-1])
+        plt.xlim(positions[0], positions[-1])
         ax = plt.gca()
 
         if days_range == 2 and investment_amount < 7:
-            ax.yaxis.set_major_formatter(mticker.FuncFormatter(lambda x, _: f'${x:,.3f}'))
+            ax.yaxis.set_major_formatter(StockTracker.TENTH_CENTS_FORMATTER)
         elif investment_amount < 31:
-            ax.yaxis.set_major_formatter(mticker.FuncFormatter(lambda x, _: f'${x:,.2f}'))
+            ax.yaxis.set_major_formatter(StockTracker.CENTS_FORMATTER)
         else:
-            ax.yaxis.set_major_formatter(mticker.FuncFormatter(lambda x, _: f'${x:,.0f}'))
+            ax.yaxis.set_major_formatter(StockTracker.DOLLARS_FORMATTER)
 
         plt.tight_layout()
         plt.show()
+        plt.close(fig)
 
     def percentage_change_alert(self, list_of_tickers, alert_threshold, recipient_email, verbose=False):
         """
@@ -885,44 +1028,65 @@ class StockTracker:
             If True, detailed console output is printed during execution.
         """
 
-        today = datetime.now().date()
-        nyse = mcal.get_calendar("NYSE")
-        trading_schedule = nyse.schedule(start_date=today, end_date=today)
-
-        utc_time = datetime.now(tz=ZoneInfo("UTC"))
-        eastern_time = utc_time.astimezone(ZoneInfo("America/New_York")).time()
-        market_open_time = time(hour=9, minute=30, second=0)
-        market_close_time = time(hour=16, minute=0, second=0)
+        today, eastern_time = self.get_market_clock()
+        # Weekends are never trading days, so only weekdays need the (memoised) NYSE schedule to rule out holidays
+        is_trading_day = today.weekday() < 5 and not self.get_trading_schedule(today).empty
+
+        # Work out the market phase once so each branch below is a single lookup
+        if not is_trading_day:
+            phase = "closed"
+        elif eastern_time < StockTracker.MARKET_OPEN_TIME:
+            phase = "pre"
+        elif eastern_time < StockTracker.MARKET_CLOSE_TIME:
+            phase = "open"
+        else:
+            phase = "post"
 
         strings = []
 
-        if today in trading_schedule.index.date and eastern_time >= market_close_time:
-            for ticker in list_of_tickers:
+        if phase == "post":
+            # One batched download covers every ticker's last two sessions instead of a request per ticker
+            downloaded = None
+            if list_of_tickers:
                 try:
-                    ticker_object = yf.Ticker(ticker)
-                    history = ticker_object.history(period="2d")
+                    downloaded = yf.download(list_of_tickers, period="2d", interval="1d", group_by="ticker", auto_adjust=True, threads=True, progress=False)
                 except Exception as e:
                     if verbose:
-                        print(f"\n⚠️  Error fetching data for {ticker}: {e}")
-                    continue
+                        print(f"\n⚠️  Error fetching data for {', '.join(list_of_tickers)}: {e}")
+
+            # Wide frame of closing prices with one column per ticker; tickers that failed to download come back missing or all-NaN
+            unique_tickers = list(dict.fromkeys(list_of_tickers))
+            if downloaded is not None and "Close" in downloaded.columns.get_level_values(-1):
+                closes = downloaded.xs("Close", axis=1, level=-1).reindex(columns=unique_tickers)
+            else:
+                closes = pd.DataFrame(columns=unique_tickers, dtype="float64")
+
+            # Every ticker's change from its last two valid closes in one vectorised pass:
+            # the forward-filled last row is the latest close, and hiding each column's final valid close first gives the one before it
+            if closes.empty:
+                percentage_changes = pd.Series(np.nan, index=unique_tickers)
+            else:
+                valid_counts = closes.notna().cumsum()
+                last_closes = closes.ffill().iloc[-1]
+                prev_closes = closes.where(valid_counts < valid_counts.iloc[-1]).ffill().iloc[-1]
+                percentage_changes = ((last_closes - prev_closes) / prev_closes) * 100
+
+            directions = pd.Series(np.select([percentage_changes > alert_threshold, percentage_changes < -alert_threshold], ["rose", "dropped"], default=""), index=percentage_changes.index)
 
-                if len(history) < 2:
+            for ticker in list_of_tickers:
+                percentage_change = percentage_changes[ticker]
+
+                # NaN means fewer than two closes were available for this ticker
+                if np.isnan(percentage_change):
                     if verbose:
                         print(f"Not enough data for {ticker}")
                     continue
 
-                last_close = history["Close"].iloc[-1]
-                prev_close = history["Close"].iloc[-2]
-
-                percentage_change = ((last_close - prev_close) / prev_close) * 100
-
-                if percentage_change > alert_threshold:
-                    string = f"ALERT: {ticker} rose {percentage_change:+.2f}% today!"
-                elif percentage_change < -alert_threshold:
-                    string = f"ALERT: {ticker} dropped {percentage_change:+.2f}% today!"
+                if directions[ticker]:
+                    string = f"ALERT: {ticker} {directions[ticker]} {percentage_change:+.2f}% today!"
                 else:
-                    string = f"ALERT: {ticker} does not meet threshold requirement."   
-    
+                    string = f"ALERT: {ticker} does not meet threshold requirement."
+
                 strings.append(string)
                 if verbose:
                     print(f"\n{string}")
@@ -930,21 +1094,10 @@ class StockTracker:
             if not strings:
                 strings.append("No valid alerts generated today.")  
             body = f"Daily Stock Alerts:\n\n{'\n'.join(strings)}"
-        elif today in trading_schedule.index.date and eastern_time < market_open_time:
-            string = "Market not yet open — waiting to open."
-            if verbose:
-                print(f"\n{string}")
-            body = string
-        elif today in trading_schedule.index.date and (market_open_time <= eastern_time < market_close_time):
-            string = "Market is open — wait until close for daily % change."
-            if verbose:
-                print(f"\n{string}")
-            body = string
-        elif today not in trading_schedule.index.date:
-            string = "Market closed today (holiday/weekend)."
+        else:
+            body = self.MARKET_PHASE_MESSAGES[phase]
             if verbose:
-                print(f"\n{string}")
-            body = string
+                print(f"\n{body}")
 
         subject = f"Stock Market Update - {today.strftime('%d %b %Y')}"
         self.email_alerts(subject, recipient_email, body)
@@ -978,18 +1131,78 @@ class StockTracker:
         msg["To"] = to
         msg.set_content(body)
 
-        # Connect to Gmail’s SMTP server using SSL and send the email
+        # Send through Gmail’s SMTP server over SSL, reusing the logged-in connection from any previous alert
         try:
-            with smtplib.SMTP_SSL("smtp.gmail.com", 465) as smtp:
-                smtp.login(EMAIL_ADDRESS, EMAIL_PASSWORD)
-                smtp.send_message(msg)
+            smtp = StockTracker.get_smtp_connection(EMAIL_ADDRESS, EMAIL_PASSWORD)
+            smtp.send_message(msg)
         except smtplib.SMTPAuthenticationError:
             print(f"\n❌  Authentication failed, Check your email and password environment variables")
         except (smtplib.SMTPException, socket.gaierror) as e:
+            StockTracker.close_smtp_connection() # Don't reuse a connection that just failed
             print(f"\n❌  Failed to send email: {e}")
         except Exception as e:
+            StockTracker.close_smtp_connection()
             print(f"\n❌  Unexpected error while sending email: {e}")
 
+    @staticmethod
+    def get_smtp_connection(email_address, email_password):
+        """
+        Return a logged-in connection to Gmail's SMTP server.
+
+        The connection is kept open between alerts so later emails skip the
+        TLS handshake and login. It is replaced if the server has closed it.
+
+        Parameters
+        ----------
+        email_address : str
+            The account to log in with.
+        email_password : str
+            The account's app password.
+
+        Returns
+        -------
+        smtplib.SMTP_SSL
+            The open, authenticated connection.
+        """
+
+        smtp = StockTracker.SMTP_CONNECTION
+        if smtp is not None:
+            try:
+                # NOOP is one round trip, far cheaper than a new TLS handshake and login
+                if smtp.noop()[0] == 250:
+                    return smtp
+            except (smtplib.SMTPException, OSError):
+                pass
+            # The server dropped the idle connection, so discard it and log in again
+            StockTracker.close_smtp_connection()
+
+        smtp = smtplib.SMTP_SSL("smtp.gmail.com", 465)
+        try:
+            smtp.login(email_address, email_password)
+        except Exception:
+            smtp.close()
+            raise
+
+        StockTracker.SMTP_CONNECTION = smtp
+        # Log out cleanly when the program exits (unregister first so the hook is only added once)
+        atexit.unregister(StockTracker.close_smtp_connection)
+        atexit.register(StockTracker.close_smtp_connection)
+        return smtp
+
+    @staticmethod
+    def close_smtp_connection():
+        """
+        Close the shared SMTP connection, if one is open.
+        """
+
+        smtp = StockTracker.SMTP_CONNECTION
+        StockTracker.SMTP_CONNECTION = None
+        if smtp is not None:
+            try:
+                smtp.quit()
+            except (smtplib.SMTPException, OSError):
+                smtp.close()
+
     @staticmethod
     def exit_program():
         """
@@ -1000,19 +1213,178 @@ class StockTracker:
         sys.exit(0)
 
     @staticmethod
-    def save_to_csv(dataframe, filename):
+    def save_to_parquet(ticker_histories, interval):
+        """
+        Save each ticker's history to its own Parquet file without the index column.
+
+        Only the tickers passed in are written, so the cached files of any
+        other tickers are left untouched.
+
+        Parameters
+        ----------
+        ticker_histories : dict of str to pandas.DataFrame
+            The histories to save, keyed by ticker (see `split_by_ticker`).
+        interval : str
+            The data interval/granularity (e.g., '1d', '1m', '5m') used to determine the directory.
+        """
+
+        Path(StockTracker.get_directory(interval)).mkdir(parents=True, exist_ok=True)
+        for ticker, ticker_specific_dataframe in ticker_histories.items():
+            # zstd gives noticeably smaller files than the default snappy codec at a similar read speed
+            ticker_specific_dataframe.to_parquet(StockTracker.get_filename(ticker, interval), engine="pyarrow", compression="zstd", index=False)
+
+    @staticmethod
+    def export_to_csv(interval):
+        """
+        Export every cached ticker of an interval to a single CSV file.
+
+        The Parquet files remain the cache; the CSV is only written when the
+        user asks for it, as a copy that can be opened in a spreadsheet.
+
+        Parameters
+        ----------
+        interval : str
+            The data interval/granularity (e.g., '1d', '1m', '5m') to export.
+        """
+
+        export_filename = f"data/historical_data_{interval}_export.csv"
+
+        try:
+            history = StockTracker.load_tickers(StockTracker.get_cached_tickers(interval), interval).sort_values(by=["Ticker", "Date"])
+            # Write Date in pandas' ISO format ('2024-12-16 00:00:00-05:00') rather than Arrow's nanosecond timestamps
+            history = history.assign(Date=history["Date"].astype(str))
+            # pyarrow encodes the columns in C across threads, much faster than pandas' row-by-row CSV writer
+            pa_csv.write_csv(pa.Table.from_pandas(history, preserve_index=False), export_filename)
+        except PermissionError as e:
+            print(f"\n⚠️  Could not write {export_filename}, Check file permissions: {e}")
+        except (ValueError, OSError) as e:
+            print(f"\n⚠️  Could not export the **{interval}** data: {e}")
+        else:
+            print(f"\nℹ️  Exported {len(history)} rows to {export_filename}")
+
+    @staticmethod
+    def load_tickers(list_of_tickers, interval):
         """
-        Save a DataFrame to a CSV file without the index column.
+        Load the cached Parquet files of the given tickers into a single DataFrame.
+
+        Parameters
+        ----------
+        list_of_tickers : list of str
+            The tickers to load. Tickers without a cached file are skipped.
+        interval : str
+            The data interval/granularity (e.g., '1d', '1m', '5m') used to determine the directory.
+
+        Returns
+        -------
+        pandas.DataFrame
+            DataFrame holding the rows of every cached ticker, with 'Date' in
+            'America/New_York' timezone. Empty (but correctly typed) if none are cached.
+        """
+
+        frames = []
+        for ticker in list_of_tickers:
+            filename = StockTracker.get_filename(ticker, interval)
+            if Path(filename).exists():
+                # Memory-map the file so pyarrow reads column buffers straight from the OS page cache
+                frames.append(pd.read_parquet(filename, memory_map=True))
+
+        if frames:
+            df = StockTracker.concat_frames(frames)
+            # Store tickers as categorical so filters and groupbys compare integer codes instead of strings
+            df["Ticker"] = df["Ticker"].astype("category")
+            return df
+
+        # Forces each column into the correct data type so callers can filter/concat as usual
+        return pd.DataFrame(columns=StockTracker.COLUMN_NAMES).astype({
+            "Date": "datetime64[ns, America/New_York]",
+            "Open": "float64",
+            "High": "float64",
+            "Low": "float64",
+            "Close": "float64",
+            "Volume": "Int64",
+            "Ticker": "category"
+        })
+
+    @staticmethod
+    def concat_frames(frames):
+        """
+        Concatenate a list of DataFrames into one with a fresh index.
+
+        A single-element list (e.g. one ticker's cache with nothing new to add)
+        is returned as-is, skipping the block consolidation `pd.concat` would
+        still perform.
+
+        Parameters
+        ----------
+        frames : list of pandas.DataFrame
+            The DataFrames to concatenate. Must not be empty.
+
+        Returns
+        -------
+        pandas.DataFrame
+            The combined DataFrame.
+        """
+
+        if len(frames) == 1:
+            return frames[0]
+
+        return pd.concat(frames, ignore_index=True)
+
+    @staticmethod
+    def split_by_ticker(dataframe):
+        """
+        Split a history DataFrame into one DataFrame per ticker.
 
         Parameters
         ----------
         dataframe : pandas.DataFrame
-            The DataFrame object to save.
-        filename : str or Path
-            Path or filename where the CSV file will be written.
+            History sorted by Ticker and Date.
+
+        Returns
+        -------
+        dict of str to pandas.DataFrame
+            Each ticker's rows in date order, with a fresh index.
+        """
+
+        # groupby keeps the existing row order within each group, so every ticker stays sorted by Date
+        return {ticker: group.reset_index(drop=True) for ticker, group in dataframe.groupby("Ticker", sort=False, observed=True)}
+
+    @staticmethod
+    def merge_ticker_history(cached_history, fetched_frames):
+        """
+        Merge newly fetched rows into a single ticker's cached history.
+
+        Parameters
+        ----------
+        cached_history : pandas.DataFrame or None
+            The ticker's cached rows sorted by Date, or None if it isn't cached yet.
+        fetched_frames : list of pandas.DataFrame
+            The ticker's newly fetched rows.
+
+        Returns
+        -------
+        pandas.DataFrame
+            The combined history without duplicate dates, sorted by Date.
         """
 
-        dataframe.to_csv(filename, index=False)
+        frames = fetched_frames if cached_history is None else [cached_history, *fetched_frames]
+        merged_history = StockTracker.concat_frames(frames)
+
+        # mergesort is stable and fast on input that is already mostly in date order
+        merged_history = merged_history.sort_values(by="Date", kind="mergesort", ignore_index=True)
+
+        # Once sorted, duplicate dates sit next to each other, so comparing neighbours finds them without hashing every row
+        # The sort is stable and the cached rows come first, so keeping the first copy keeps the cached row over a refetched one
+        dates = merged_history["Date"].array.asi8
+        is_new_date = np.empty(len(dates), dtype=bool)
+        is_new_date[:1] = True
+        np.not_equal(dates[1:], dates[:-1], out=is_new_date[1:])
+        if not is_new_date.all():
+            merged_history = merged_history[is_new_date].reset_index(drop=True)
+
+        # Newly fetched rows carry plain string tickers, so re-encode the column as categorical (integer codes)
+        merged_history["Ticker"] = merged_history["Ticker"].astype("category")
+        return merged_history
 
     @staticmethod
     def load_from_csv(filename):
@@ -1035,30 +1407,99 @@ class StockTracker:
         """
 
         if Path(filename).exists():
-            df = pd.read_csv(filename)
-            # Parse "Date" column as timezone-aware UTC datetimes, then convert to NY time
-            df["Date"] = pd.to_datetime(df["Date"], utc=True).dt.tz_convert("America/New_York")
+            # The Arrow CSV reader parses the dates in native code while reading, rather than in a second to_datetime pass
+            # Tickers are read straight into a categorical column rather than one Python string per row
+            df = pd.read_csv(filename, engine="pyarrow", parse_dates=["Date"], dtype={"Ticker": "category"})
+            # Dates with UTC offsets are parsed as UTC; treat any without an offset as UTC too, then convert to NY time
+            if df["Date"].dt.tz is None:
+                df["Date"] = df["Date"].dt.tz_localize("UTC")
+            df["Date"] = df["Date"].dt.tz_convert("America/New_York")
             return df
         else:
             print(f"\nFile does not exist")
 
     @staticmethod
-    def get_filename(interval):
+    def migrate_legacy_csv(interval):
+        """
+        Split a legacy single-file CSV cache into per-ticker Parquet files.
+
+        Earlier versions stored every ticker of an interval in one
+        'data/historical_data_{interval}.csv' file. If that file exists and the
+        Parquet directory for the interval does not, its rows are converted once
+        so previously cached data is not lost. The CSV file itself is left in place.
+
+        Parameters
+        ----------
+        interval : str
+            The data interval/granularity (e.g., '1d', '1m', '5m') to migrate.
+        """
+
+        legacy_filename = f"data/historical_data_{interval}.csv"
+
+        if Path(legacy_filename).exists() and not Path(StockTracker.get_directory(interval)).exists():
+            try:
+                StockTracker.save_to_parquet(StockTracker.split_by_ticker(StockTracker.load_from_csv(legacy_filename)), interval)
+                print(f"\nℹ️  Migrated {legacy_filename} to per-ticker Parquet files in {StockTracker.get_directory(interval)}")
+            except pd.errors.ParserError as e:
+                print(f"\n⚠️  Could not migrate {legacy_filename}, File may be corrupted: {e}")
+            except (PermissionError, OSError) as e:
+                print(f"\n⚠️  Could not migrate {legacy_filename}: {e}")
+
+    @staticmethod
+    def get_cached_tickers(interval):
+        """
+        List the tickers that have a cached Parquet file for the interval.
+
+        Parameters
+        ----------
+        interval : str
+            The data interval/granularity (e.g., '1d', '1m', '5m') used to determine the directory.
+
+        Returns
+        -------
+        list of str
+            The cached ticker symbols.
+        """
+
+        return [path.stem for path in Path(StockTracker.get_directory(interval)).glob("*.parquet")]
+
+    @staticmethod
+    def get_directory(interval):
+        """
+        Generate the directory holding the per-ticker historical data files of an interval.
+
+        Parameters
+        ----------
+        interval : str
+            The data interval/granularity (e.g., '1d', '1m', '5m') used to determine the directory.
+
+        Returns
+        -------
+        str
+            Path to the directory corresponding to the given interval.
+        """
+
+        return f"data/historical_data_{interval}"
+
+    @staticmethod
+    def get_filename(ticker, interval):
         """
-        Generate a filename for storing historical data based on the interval.
+        Generate a filename for storing a ticker's historical data based on the interval.
 
         Parameters
         ----------
+        ticker : str
+            The stock ticker symbol the file belongs to.
         interval : str
             The data interval/granularity (e.g., '1d', '1m', '5m') used to determine the filename.
         
         Returns
         -------
         str
-            Path to the CSV file corresponding to the given interval.
+            Path to the Parquet file corresponding to the given ticker and interval.
         """
 
-        return f"data/historical_data_{interval}.csv"
+        return f"{StockTracker.get_directory(interval)}/{ticker}.parquet"
 
     @staticmethod
     def get_internal_missing_ranges(dataframe, start, end, interval):
@@ -1071,7 +1512,7 @@ class StockTracker:
         Parameters
         ----------
         dataframe : pandas.DataFrame
-            The dataset to check for gaps.
+            The dataset to check for gaps, sorted by Date.
         start : datetime-like
             Start of the requested date range.
         end : datetime-like
@@ -1085,36 +1526,36 @@ class StockTracker:
             A list of (start, end) pairs representing the missing ranges.
         """
 
-        # Extract only the rows that fall within the requested date range
-        requested_range_dataframe  = dataframe[(dataframe["Date"] >= start) & (dataframe["Date"] <= end)].sort_values(by="Date")
+        # Extract only the dates that fall within the requested date range
+        # The dates are already sorted, so two binary searches find the slice without a boolean mask or re-sort
+        dates = pd.DatetimeIndex(dataframe["Date"]).as_unit("ns")
+        dates = dates[dates.searchsorted(start, side="left"):dates.searchsorted(end, side="right")]
+        step = StockTracker.INTERVAL_TO_TIMEDIFF[interval]
 
         gaps = []
 
         # Case 1: No rows at all → entire requested range is missing
-        if requested_range_dataframe.empty:
+        if dates.empty:
             return [(start, end)]
         
         # Case 2: Check if first row starts after the requested start
-        first_row_date = requested_range_dataframe["Date"].iloc[0]
+        first_row_date = dates[0]
         if first_row_date > start:
             # Gap from requested start until the first available date
             gaps.append((start, first_row_date))
         
         # Case 3: Look for gaps *inside* the available rows
-        for i in range(len(requested_range_dataframe) - 1):
-            current_date = requested_range_dataframe["Date"].iloc[i]
-            next_date = requested_range_dataframe["Date"].iloc[i+1]
-
-            # If the next row jumps by more than one interval → gap
-            if next_date > current_date + StockTracker.INTERVAL_TO_TIMEDIFF[interval]:
-                # Gap starts just after current_date, and ends at next_date
-                gaps.append((current_date + StockTracker.INTERVAL_TO_TIMEDIFF[interval], next_date))
+        # Scan the int64 (nanosecond) view of the dates in one vectorised pass instead of a Python loop
+        # Positions where the next row jumps by more than one interval → gap
+        gap_positions = np.flatnonzero(np.diff(dates.asi8) > step.value)
+        # Each gap starts just after the current date and ends at the next date, built for all gaps at once
+        gaps.extend(zip(dates[gap_positions] + step, dates[gap_positions + 1]))
 
         # Case 4: Check if last row ends before the requested end
-        last_row_date = requested_range_dataframe["Date"].iloc[-1]
-        if (last_row_date + StockTracker.INTERVAL_TO_TIMEDIFF[interval]) < end:
+        last_row_date = dates[-1]
+        if (last_row_date + step) < end:
             # Gap from just after last available date until requested end
-            gaps.append((last_row_date + StockTracker.INTERVAL_TO_TIMEDIFF[interval], end))
+            gaps.append((last_row_date + step, end))
 
         return gaps
 
@@ -1145,7 +1586,8 @@ class StockTracker:
         -------
         pandas.DataFrame
             A DataFrame containing the last N trading days of data 
-            for the given ticker, guaranteed to be complete.
+            for the given ticker, guaranteed to be complete, with a 
+            'Shortend Date' (DD-MM-YYYY) column for chart labels.
         pandas.DatetimeIndex
             A sequence of valid NYSE trading days covering the 
             requested lookback window.
@@ -1154,152 +1596,232 @@ class StockTracker:
             the dataset has fewer available rows.
         """
 
-        today = datetime.now().date()
-        nyse = mcal.get_calendar("NYSE")
-        trading_schedule = nyse.schedule(start_date=today, end_date=today)
+        today, eastern_time = self.get_market_clock()
 
-        utc_time = datetime.now(tz=ZoneInfo("UTC"))
-        eastern_time = utc_time.astimezone(ZoneInfo("America/New_York")).time()
-        market_close_time = time(hour=16, minute=0, second=0)
-        
-        if ticker in StockTracker.MASTER_HISTORY["Ticker"].values:
-            ticker_specific_dataframe = StockTracker.MASTER_HISTORY[StockTracker.MASTER_HISTORY["Ticker"] == ticker]
+        # One calendar lookup covering the past year up to and including today; each branch below only slices it
+        all_trading_days = self.get_valid_trading_days(today - pd.Timedelta(days=365), today)
+        is_trading_day = all_trading_days[-1].date() == today
+
+        # Today is a trading day but the market hasn't closed yet, so today's row isn't final; the last complete trading day is the previous one
+        # Otherwise (market closed for today, or a weekend/holiday) the most recent trading day in the calendar is complete
+        # NOTE: valid_trading_days only goes back 40 trading days (adjust if longer lookback is needed)
+        if is_trading_day and eastern_time < StockTracker.MARKET_CLOSE_TIME:
+            valid_trading_days = all_trading_days[:-1][-StockTracker.MAX_LOOKBACK_DAYS:]
+        else:
+            valid_trading_days = all_trading_days[-StockTracker.MAX_LOOKBACK_DAYS:]
+
+        # Look the ticker up in the master history; None means the ticker isn't cached yet
+        ticker_specific_dataframe = StockTracker.MASTER_HISTORY.get(ticker)
 
+        if ticker_specific_dataframe is not None:
             if len(ticker_specific_dataframe) < days_range:
                 print(f"\n⚠️  Only {len(ticker_specific_dataframe)} trading days available for {ticker}"
                     f"\nAdjusting requested range from {days_range} → {len(ticker_specific_dataframe)}")
                 days_range = len(ticker_specific_dataframe)
 
-            # Today is a trading day and the market has closed for today
-            if today in trading_schedule.index.date and eastern_time >= market_close_time:
-                list_of_valid_trading_days = []
-                list_of_actual_trading_days = []
+            # The last N trading days as a datetime64[D] array (oldest first)
+            valid_days = self.to_trading_dates(valid_trading_days[-days_range:])
 
-                all_trading_days = nyse.valid_days(start_date=today - pd.Timedelta(days=365), end_date=today)
+            # The last N dates actually present in the cache for this ticker, converted in one pass (oldest first)
+            actual_days = self.to_trading_dates(ticker_specific_dataframe["Date"].tail(days_range))
 
-                # Get all valid trading days up to and including today if it's a trading day
-                # NOTE: valid_trading_days only goes back 40 trading days (adjust if longer lookback is needed)
-                valid_trading_days = all_trading_days[-StockTracker.MAX_LOOKBACK_DAYS:]
+            # Check if the last N valid trading days match exactly the last N dates in the cache
+            is_missing_dates = not np.array_equal(valid_days, actual_days)
+        else:
+            is_missing_dates = True
 
-                # Append the last N trading days starting from the most recent (working backwards)
-                for i in range(days_range):
-                    list_of_valid_trading_days.append(valid_trading_days[-1 - i].date())
+        if is_missing_dates:
+            # Fetch historical data for this ticker because the cache is missing some dates (or the ticker isn't cached at all)
+            # Start date:
+            #   - valid_trading_days[-days_range] gives the oldest date in our last N valid trading days
+            # End date:
+            #   - fetch_historical_data treats start date as inclusive, end date as exclusive
+            #   - the most recent complete trading day + 1 day ensures that day is included, while an unfinished today is excluded
+            most_recent_trading_day = valid_trading_days[-1].date()
+            self.fetch_historical_data([ticker], valid_trading_days[-days_range].strftime("%Y-%m-%d"), (most_recent_trading_day + pd.Timedelta(days=1)).strftime("%Y-%m-%d"), "1d")
 
-                # Collect the last N dates actually present in the CSV for this ticker (most recent first)
-                for i in range(days_range):
-                    day = pd.to_datetime(ticker_specific_dataframe["Date"].iloc[-1 - i]).date()
-                    list_of_actual_trading_days.append(day)
+        # fetch_historical_data replaces this ticker's entry when it runs, so look it up again (a cheap dict access)
+        ticker_specific_dataframe = StockTracker.MASTER_HISTORY[ticker]
 
-                # Check if the last N valid trading days match exactly the last N dates in the CSV
-                if list_of_valid_trading_days == list_of_actual_trading_days:
-                    pass
-                else:
-                    # Fetch historical data for this ticker because the CSV is missing some dates
-                    # Start date:
-                    #   - list_of_valid_trading_days[-1] gives the oldest date in our last N valid trading days
-                    #   - valid trading days are stored in reverse chronological order (most recent first)
-                    # End date:
-                    #   - fetch_historical_data treats start date as inclusive, end date as exclusive
-                    #   - today + pd.Timedelta(days=1) ensures that today’s row (most recent trading day) is included in the fetch
-                    self.fetch_historical_data([ticker], list_of_valid_trading_days[-1].strftime("%Y-%m-%d"), (today + pd.Timedelta(days=1)).strftime("%Y-%m-%d"), "1d")
-
-            # Today is a trading day and the market is still open or waiting to open
-            elif today in trading_schedule.index.date and eastern_time < market_close_time:
-                list_of_valid_trading_days = []
-                list_of_actual_trading_days = []
-
-                all_trading_days = nyse.valid_days(start_date=today - pd.Timedelta(days=365), end_date=today - pd.Timedelta(days=1))
-
-                # Get all valid trading days up to yesterday
-                # Exclude today because the market is still open; the last valid trading day is yesterday
-                valid_trading_days = all_trading_days[-StockTracker.MAX_LOOKBACK_DAYS:]
-
-                # Append the last N trading days starting from the most recent (working backwards)
-                # Because we have excluded today from valid_trading_days, valid_trading_days[-1] would be yesterday
-                for i in range(days_range):
-                    list_of_valid_trading_days.append(valid_trading_days[-1 - i].date())
-
-                # Collect the last N dates actually present in the CSV for this ticker (most recent first)
-                for i in range(days_range):
-                    day = pd.to_datetime(ticker_specific_dataframe["Date"].iloc[-1 - i]).date()
-                    list_of_actual_trading_days.append(day)
-
-                # Check if the last N valid trading days match exactly the last N dates in the CSV
-                if list_of_valid_trading_days == list_of_actual_trading_days:
-                    pass
-                else:
-                    # Fetch historical data for this ticker because the CSV is missing some dates
-                    # Start date:
-                    #   - list_of_valid_trading_days[-1] gives the oldest date in our last N valid trading days
-                    # End date:
-                    #   - fetch_historical_data treats start date as inclusive, end date as exclusive
-                    #   - valid_trading_days ends at yesterday since the market is still open 
-                    #   - using today as the end date ensures yesterday’s data is included, while today itself is excluded
-                    self.fetch_historical_data([ticker], list_of_valid_trading_days[-1].strftime("%Y-%m-%d"), today.strftime("%Y-%m-%d"), "1d")
-
-            # Today is not a trading day (weekend/holiday)
-            else:
-                list_of_valid_trading_days = []
-                list_of_actual_trading_days = []
+        requested_range_dataframe = ticker_specific_dataframe.tail(days_range)
 
-                all_trading_days = nyse.valid_days(start_date=today - pd.Timedelta(days=365), end_date=today)
+        # Format the chart axis labels once here rather than in every chart method
+        requested_range_dataframe = requested_range_dataframe.assign(**{"Shortend Date": self.to_short_dates(requested_range_dataframe["Date"])})
 
-                # Get all valid trading days up to today
-                # If today is not a trading day, valid_trading_days[-1] gives the most recent trading day before today
-                valid_trading_days = all_trading_days[-StockTracker.MAX_LOOKBACK_DAYS:]
-                most_recent_trading_day = valid_trading_days[-1].date()
+        return requested_range_dataframe, valid_trading_days, days_range
 
-                # Append the last N trading days starting from the most recent (working backwards)
-                for i in range(days_range):
-                    list_of_valid_trading_days.append(valid_trading_days[-1 - i].date())
+    @staticmethod
+    def get_market_clock():
+        """
+        Read the clock once for the market-hours checks.
 
-                # Collect the last N dates actually present in the CSV for this ticker (most recent first)
-                for i in range(days_range):
-                    day = pd.to_datetime(ticker_specific_dataframe["Date"].iloc[-1 - i]).date()
-                    list_of_actual_trading_days.append(day)
+        Returns
+        -------
+        datetime.date
+            Today's local date.
+        datetime.time
+            The current time of day in New York.
+        """
 
-                # Check if the last N valid trading days match exactly the last N dates in the CSV
-                if list_of_valid_trading_days == list_of_actual_trading_days:
-                    pass
-                else:
-                    # Fetch historical data for this ticker because the CSV is missing some dates
-                    # Start date:
-                    #   - list_of_valid_trading_days[-1] gives the oldest date in our last N valid trading days
-                    # End date: most recent trading day (e.g., Friday if today is Sunday) + 1 day
-                    #   - +1 ensures the most recent trading day is included because start is inclusive and end is exclusive
-                    self.fetch_historical_data([ticker], list_of_valid_trading_days[-1].strftime("%Y-%m-%d"), (most_recent_trading_day + pd.Timedelta(days=1)).strftime("%Y-%m-%d"), "1d")
-        else:
-            # Today is a trading day and the market has closed for today
-            if today in trading_schedule.index.date and eastern_time >= market_close_time:
-                all_trading_days = nyse.valid_days(start_date=today - pd.Timedelta(days=365), end_date=today)
-                # Get all valid trading days up to and including today if it's a trading day
-                # NOTE: valid_trading_days only goes back 90 days (adjust if longer lookback is needed)
-                valid_trading_days = all_trading_days[-StockTracker.MAX_LOOKBACK_DAYS:]
-                # Start date: valid_trading_days[-days_range] → the Nth most recent trading day (inclusive)
-                # End date: today + 1 day → ensures today’s trading data is included 
-                self.fetch_historical_data([ticker], valid_trading_days[-days_range].strftime("%Y-%m-%d"), (today + pd.Timedelta(days=1)).strftime("%Y-%m-%d"), "1d")
-
-            # Today is a trading day and the market is still open or waiting to open
-            elif today in trading_schedule.index.date and eastern_time < market_close_time:
-                all_trading_days = nyse.valid_days(start_date=today - pd.Timedelta(days=365), end_date=today - pd.Timedelta(days=1))
-                # Get all valid trading days up to yesterday
-                # Exclude today because the market is still open; the last valid trading day is yesterday
-                valid_trading_days = all_trading_days[-StockTracker.MAX_LOOKBACK_DAYS:]
-                # Start date: valid_trading_days[-days_range] → the Nth most recent trading day (inclusive)
-                # End date: today → excludes today (market still open), but includes yesterday’s data
-                self.fetch_historical_data([ticker], valid_trading_days[-days_range].strftime("%Y-%m-%d"), today.strftime("%Y-%m-%d"), "1d")
-
-            # Today is not a trading day (weekend/holiday)
-            else:
-                all_trading_days = nyse.valid_days(start_date=today - pd.Timedelta(days=365), end_date=today)
-                # Get all valid trading days up to "today" (if today is not a trading day, this will automatically stop at the most recent valid trading day, e.g. Friday if it's the weekend)
-                valid_trading_days = all_trading_days[-StockTracker.MAX_LOOKBACK_DAYS:]
-                most_recent_trading_day = valid_trading_days[-1].date()
-                # Start date: valid_trading_days[-days_range] → the Nth most recent trading day (inclusive)
-                # End date = most recent trading day + 1 day (exclusive) → ensures the most recent trading day itself is included
-                self.fetch_historical_data([ticker], valid_trading_days[-days_range].strftime("%Y-%m-%d"), (most_recent_trading_day + pd.Timedelta(days=1)).strftime("%Y-%m-%d"), "1d")
+        utc_time = datetime.now(tz=ZoneInfo("UTC"))
+        # astimezone() with no argument converts to local time, matching datetime.now().date()
+        return utc_time.astimezone().date(), utc_time.astimezone(ZoneInfo("America/New_York")).time()
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_nyse_calendar():
+        """
+        Return the NYSE market calendar, building it only once per run.
+
+        Returns
+        -------
+        pandas_market_calendars.MarketCalendar
+            The shared NYSE calendar instance.
+        """
+
+        # Imported here so sessions that never need the calendar skip loading pandas_market_calendars
+        import pandas_market_calendars as mcal
+
+        return mcal.get_calendar("NYSE")
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_pyplot():
+        """
+        Import matplotlib's pyplot and apply the chart theme, only once per run.
+
+        seaborn and matplotlib take a noticeable time to import, so they are
+        loaded the first time a chart is drawn rather than at start-up (live
+        prices and the scheduled alerts never need them).
+
+        Returns
+        -------
+        module
+            The themed `matplotlib.pyplot` module.
+        """
+
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+
+        # The chart theme is global matplotlib state, so apply it once here rather than on every chart
+        sns.set_style("whitegrid")
+        sns.set_context("notebook")
+
+        return plt
+
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def get_trading_schedule(day):
+        """
+        Return the NYSE trading schedule for a single day, memoised per day.
+
+        Parameters
+        ----------
+        day : datetime.date
+            The day to look up.
+
+        Returns
+        -------
+        pandas.DataFrame
+            The schedule for that day (empty on weekends and holidays).
+            Shared between callers, so it must not be modified.
+        """
+
+        return StockTracker.get_nyse_calendar().schedule(start_date=day, end_date=day)
+
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def get_valid_trading_days(start_date, end_date):
+        """
+        Return the NYSE trading days between two dates, memoised per date range.
+
+        Parameters
+        ----------
+        start_date : datetime.date
+            The first day of the range (inclusive).
+        end_date : datetime.date
+            The last day of the range (inclusive).
+
+        Returns
+        -------
+        pandas.DatetimeIndex
+            The valid trading days in the range (UTC midnights).
+        """
+
+        return StockTracker.get_nyse_calendar().valid_days(start_date=start_date, end_date=end_date)
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def to_new_york_timestamp(date):
+        """
+        Parse a date into a New York timezone timestamp, memoised per input.
+
+        Parameters
+        ----------
+        date : str or datetime-like
+            The date to parse (e.g. '2025-01-31').
+
+        Returns
+        -------
+        pandas.Timestamp
+            The date localised to New York if it was naive, or converted to New York if it was tz-aware.
+        """
+
+        # Convert string to datetime (defaults to naive/no timezone)
+        timestamp = pd.to_datetime(date)
+        # If naive (no timezone), attach New York timezone
+        # If already tz-aware, convert it to New York timezone
+        if timestamp.tzinfo is None:
+            return timestamp.tz_localize("America/New_York")
+        return timestamp.tz_convert("America/New_York")
+
+    @staticmethod
+    def to_trading_dates(trading_days):
+        """
+        Convert trading days into a plain datetime64[D] array.
+
+        Comparing two sorted datetime64[D] arrays with `np.array_equal` is a single
+        int64 array comparison, rather than an element-by-element comparison of
+        Python date objects.
+
+        Parameters
+        ----------
+        trading_days : pandas.DatetimeIndex or pandas.Series
+            Trading days as returned by `valid_days` (UTC midnights), or a
+            tz-aware "Date" column from the cache.
+
+        Returns
+        -------
+        numpy.ndarray
+            The trading days as a datetime64[D] array, in the same order.
+        """
+
+        # Dropping the timezone keeps the local wall time, so truncating to days leaves the plain trading date
+        return pd.DatetimeIndex(trading_days).tz_localize(None).to_numpy().astype("datetime64[D]")
+
+    @staticmethod
+    def to_short_dates(dates):
+        """
+        Format dates as DD-MM-YYYY strings for chart labels.
+
+        Rearranges the characters of NumPy's ISO date strings in one array
+        operation instead of calling `strftime` on every row.
 
-        return StockTracker.MASTER_HISTORY[StockTracker.MASTER_HISTORY["Ticker"] == ticker].tail(days_range), valid_trading_days, days_range
+        Parameters
+        ----------
+        dates : pandas.Series
+            A tz-aware "Date" column.
+
+        Returns
+        -------
+        numpy.ndarray
+            The dates as DD-MM-YYYY strings, in the same order.
+        """
+
+        iso_dates = np.datetime_as_string(StockTracker.to_trading_dates(dates)).astype("<U10") # "YYYY-MM-DD"
+        # View each 10-character string as a row of single characters, then pick them in DD-MM-YYYY order
+        characters = iso_dates.view("<U1").reshape(-1, 10)
+        return characters[:, [8, 9, 7, 5, 6, 4, 0, 1, 2, 3]].copy().view("<U10").ravel()
 
     @staticmethod
     def get_start_date(today, lower_bound_date):
@@ -1387,8 +1909,7 @@ class StockTracker:
             The validated interval input by the user.
         """
 
-        print(f"\nValid intervals:")
-        print(", ".join(StockTracker.INTERVAL_TO_TIMEDIFF.keys()))
+        print(f"\nValid intervals:\n{', '.join(StockTracker.INTERVAL_TO_TIMEDIFF)}")
         while True:
             try:
                 interval = input(f"\nEnter an interval: ").strip().lower()
@@ -1405,6 +1926,8 @@ class StockTracker:
 
         The method repeatedly requests input until a valid ticker symbol 
         is provided. A ticker is considered valid if it exists on Yahoo Finance.
+        Tickers already validated this session or present in the daily cache
+        are accepted without another network lookup.
     
         Returns
         -------
@@ -1416,19 +1939,30 @@ class StockTracker:
             try:
                 ticker = input(f"\nEnter a ticker: ").strip().upper()
 
-                if not self.has_internet():
-                    raise ValueError("\n⚠️  Network error: Unable to fetch data, Please check your connection")
+                if not ticker:
+                    raise ValueError("Invalid ticker symbol, Please try again")
+
+                # Tickers validated earlier this session or already in the daily cache are known to exist, so skip the network round-trip
+                if ticker in StockTracker.VALIDATED_TICKERS or ticker in (StockTracker.MASTER_HISTORY or {}):
+                    return ticker
 
                 ticker_object = yf.Ticker(ticker)
                 history = ticker_object.history(period="1d")
                 if history.empty:
+                    # Only check the connection once a lookup fails, to tell a network problem apart from an invalid symbol
+                    if not self.has_internet():
+                        raise ValueError("\n⚠️  Network error: Unable to fetch data, Please check your connection")
                     raise ValueError("Invalid ticker symbol, Please try again")
             except ValueError as e:
                 print(e)
             except Exception as e:
-                # Something else went wrong (API error, corrupted response, etc.)
-                print(f"\n⚠️  Unexpected error: {e}")
+                if not self.has_internet():
+                    print("\n⚠️  Network error: Unable to fetch data, Please check your connection")
+                else:
+                    # Something else went wrong (API error, corrupted response, etc.)
+                    print(f"\n⚠️  Unexpected error: {e}")
             else:
+                StockTracker.VALIDATED_TICKERS.add(ticker)
                 return ticker
         
     @staticmethod  
@@ -1495,29 +2029,8 @@ class StockTracker:
             try:
                 recipient_email = input(f"\nEnter your email address: ").strip()
 
-                if recipient_email.count("@") != 1:
-                    raise ValueError("Invalid email, Please try again")
-                
-                if " " in recipient_email:
-                    raise ValueError("Invalid email, Please try again")
-                
-                local, domain = recipient_email.split("@")
-
-                if not local or not domain:
+                if not StockTracker.EMAIL_PATTERN.fullmatch(recipient_email):
                     raise ValueError("Invalid email, Please try again")
-                
-                if local[0] == "." or local[-1] == "." or ".." in local:
-                    raise ValueError("Invalid email, Please try again")
-                
-                if domain[0] == ".":
-                    raise ValueError("Invalid email, Please try again")
-                
-                if "." not in domain:
-                    raise ValueError("Invalid email, Please try again")
-                
-                if len(domain.split(".")[-1]) < 2:
-                    raise ValueError("Invalid email, Please try again")
-                
             except ValueError as e:
                 print(e)
             else:
@@ -1535,7 +2048,7 @@ class StockTracker:
         """
 
         try:
-            requests.get("https://finance.yahoo.com", timeout=3)
+            StockTracker.HTTP_SESSION.get("https://finance.yahoo.com", timeout=3)
             return True
         except requests.RequestException:
             return False
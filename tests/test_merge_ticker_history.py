@@ -0,0 +1,45 @@
+"""
+Regression tests for the timezone of the rows merged by StockTracker.merge_ticker_history.
+"""
+
+import unittest
+from unittest import mock
+
+import pandas as pd
+
+import main
+from main import StockTracker
+
+
+class TestMergeTickerHistory(unittest.TestCase):
+
+    def test_fetch_range_returns_new_york_dates_for_london_ticker(self):
+        # Ticker.history returns a London listing in the exchange's own timezone
+        london_dates = pd.DatetimeIndex(pd.to_datetime(["2025-01-02 08:00", "2025-01-03 08:00"]).tz_localize("Europe/London"), name="Date")
+        london_history = pd.DataFrame({
+            "Open": [1.0, 2.0],
+            "High": [1.0, 2.0],
+            "Low": [1.0, 2.0],
+            "Close": [1.0, 2.0],
+            "Volume": [1000, 1000],
+            "Dividends": [0.0, 0.0],
+            "Stock Splits": [0.0, 0.0]
+        }, index=london_dates)
+
+        with mock.patch.object(main.yf, "Ticker") as ticker_class:
+            ticker_class.return_value.history.return_value = london_history
+            fetched = StockTracker.fetch_range("VOD.L", pd.Timestamp("2025-01-02"), pd.Timestamp("2025-01-04"), "1d")
+
+        # Same timezone as download_history, so merging with cached rows keeps a datetime64 column
+        self.assertEqual(str(fetched["Date"].dtype), "datetime64[ns, America/New_York]")
+        self.assertEqual(fetched["Date"].tolist(), london_dates.tz_convert("America/New_York").tolist())
+        self.assertEqual(fetched["Ticker"].unique().tolist(), ["VOD.L"])
+
+        cached = fetched.iloc[:1].copy()
+        merged = StockTracker.merge_ticker_history(cached, [fetched])
+        self.assertEqual(str(merged["Date"].dtype), "datetime64[ns, America/New_York]")
+        self.assertEqual(len(merged), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()